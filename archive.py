@@ -0,0 +1,79 @@
+import statistics
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import insert, delete, select, literal, DateTime
+from kanban_app.models import Task, ArchivedTask, TaskStatus
+
+# Columnas que se copian de la tabla de tareas al archivo (el ID va a original_id)
+ARCHIVE_COLUMNS = ['title', 'description', 'project_id', 'assignee_id',
+                   'priority', 'status', 'created_at', 'updated_at']
+
+def archive_completed_tasks(db, days=30, batch_size=1000):
+    """Mover al archivo las tareas completadas hace más de `days` días
+
+    Se toma `updated_at` como fecha de finalización, ya que se actualiza
+    cada vez que cambia el estado de la tarea. Devuelve el número de
+    tareas archivadas.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    archived_at = datetime.utcnow()
+    total = 0
+
+    # Los mismos criterios se repiten al copiar y al borrar: una tarea reabierta
+    # o editada entre la selección y la escritura no debe archivarse
+    archivable = (Task.status == TaskStatus.COMPLETED, Task.updated_at < cutoff)
+
+    while True:
+        ids = [row[0] for row in db.execute(
+            select(Task.id).where(*archivable).limit(batch_size)
+        )]
+        if not ids:
+            break
+
+        # Copiar y borrar en la misma transacción para no perder tareas
+        source = select(
+            Task.id,
+            *[Task.__table__.c[name] for name in ARCHIVE_COLUMNS],
+            literal(archived_at, DateTime)
+        ).where(Task.id.in_(ids), *archivable)
+        try:
+            db.execute(
+                insert(ArchivedTask.__table__).from_select(
+                    ['original_id'] + ARCHIVE_COLUMNS + ['archived_at'], source
+                )
+            )
+            deleted = db.execute(delete(Task.__table__).where(Task.id.in_(ids), *archivable))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        total += deleted.rowcount
+
+    return total
+
+def measure_hot_path(db, repeat=5):
+    """Filas y latencia mediana (ms) de la lectura por defecto de tareas
+
+    Se hace una lectura de calentamiento antes de tomar las muestras para
+    que las cifras de antes y después de archivar sean comparables. Cada
+    muestra lee la tabla de tareas completa, así que conviene usarla solo
+    cuando se pide explícitamente.
+    """
+    rows = db.query(Task).count()
+    archived = db.query(ArchivedTask).count()
+
+    def read_tasks():
+        start = time.perf_counter()
+        [task.to_dict() for task in db.query(Task).all()]
+        elapsed = time.perf_counter() - start
+        db.expunge_all()
+        return elapsed
+
+    read_tasks()
+    samples = [read_tasks() for _ in range(repeat)]
+
+    return {
+        'rows': rows,
+        'archived_rows': archived,
+        'latency_ms': round(statistics.median(samples) * 1000.0, 3),
+    }
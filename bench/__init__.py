@@ -0,0 +1,4 @@
+"""
+Benchmarks reproducibles de TaskFlow: generador de datos sintéticos y
+driver de carga sobre la API web y la CLI
+"""
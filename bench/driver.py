@@ -0,0 +1,201 @@
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from click.testing import CliRunner
+from kanban_app.database import get_session
+from kanban_app.models import Task, Project, Assignee, TaskStatus
+
+# Mezcla por defecto de operaciones sobre la API (peso relativo)
+DEFAULT_MIX = {
+    'list_tasks': 0.55,
+    'list_tasks_filtered': 0.15,
+    'create_task': 0.10,
+    'move_task': 0.20,
+}
+
+# Comandos CLI cronometrados en cada ejecución
+DEFAULT_CLI_COMMANDS = [
+    ['kanban'],
+    ['list-tasks'],
+    ['list-projects'],
+    ['list-assignees'],
+]
+
+def _percentile(samples, pct):
+    """Percentil por el método del rango más cercano"""
+    ordered = sorted(samples)
+    index = max(0, int(round(pct / 100.0 * len(ordered))) - 1)
+    return ordered[index]
+
+def summarize(samples):
+    """Resumen estadístico (en milisegundos) de una lista de tiempos en segundos"""
+    if not samples:
+        return {'count': 0}
+    ms = [s * 1000.0 for s in samples]
+    return {
+        'count': len(ms),
+        'mean_ms': round(statistics.mean(ms), 3),
+        'p50_ms': round(_percentile(ms, 50), 3),
+        'p95_ms': round(_percentile(ms, 95), 3),
+        'p99_ms': round(_percentile(ms, 99), 3),
+        'max_ms': round(max(ms), 3),
+    }
+
+def _git_commit():
+    """Commit actual del repositorio, si está disponible"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL, text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).strip()
+    except Exception:
+        return None
+
+def _board_snapshot():
+    """Nombres de proyectos/responsables e IDs de tareas para elegir objetivos"""
+    db = get_session()
+    try:
+        project_names = [p.name for p in db.query(Project).all()]
+        assignee_names = [a.name for a in db.query(Assignee).all()]
+        task_ids = [t.id for t in db.query(Task.id).all()]
+        return project_names, assignee_names, task_ids
+    finally:
+        db.close()
+
+def run_api_load(app, requests=500, mix=None, seed=42):
+    """Reproducir una mezcla realista de peticiones contra la API con el test client"""
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    operations = list(mix.keys())
+    weights = [mix[op] for op in operations]
+    statuses = [s.value for s in TaskStatus]
+
+    project_names, assignee_names, task_ids = _board_snapshot()
+    client = app.test_client()
+    timings = {op: [] for op in operations}
+    errors = {op: 0 for op in operations}
+
+    # Silenciar los mensajes de depuración de las rutas durante la carga
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(requests):
+            op = rng.choices(operations, weights=weights)[0]
+
+            if op == 'list_tasks':
+                call = lambda: client.get('/api/tasks')
+            elif op == 'list_tasks_filtered':
+                params = {}
+                if project_names:
+                    params['project'] = rng.choice(project_names)
+                if assignee_names and rng.random() < 0.5:
+                    params['assignee'] = rng.choice(assignee_names)
+                call = lambda: client.get('/api/tasks', query_string=params)
+            elif op == 'create_task':
+                payload = {
+                    'title': f"Tarea benchmark {i}",
+                    'description': 'Creada por el driver de carga',
+                    'project_name': rng.choice(project_names) if project_names else '',
+                    'assignee_name': rng.choice(assignee_names) if assignee_names else '',
+                    'priority': rng.choice(['low', 'medium', 'high']),
+                }
+                call = lambda: client.post('/api/tasks', json=payload)
+            elif op == 'move_task':
+                if not task_ids:
+                    continue
+                task_id = rng.choice(task_ids)
+                payload = {'status': rng.choice(statuses)}
+                call = lambda: client.put(f'/api/tasks/{task_id}/status', json=payload)
+            else:
+                raise ValueError(f"Operación desconocida: {op}")
+
+            start = time.perf_counter()
+            response = call()
+            elapsed = time.perf_counter() - start
+
+            if response.status_code >= 400:
+                errors[op] += 1
+            else:
+                timings[op].append(elapsed)
+                if op == 'create_task':
+                    task_ids.append(response.get_json()['id'])
+
+    results = {}
+    for op in operations:
+        results[op] = summarize(timings[op])
+        results[op]['errors'] = errors[op]
+    return results
+
+# Marcadores con los que los comandos CLI informan de un error
+CLI_ERROR_MARKERS = ('✗', 'x ')
+
+def _cli_failed(result):
+    """Detectar un comando fallido aunque haya terminado con código 0
+
+    Los comandos capturan sus excepciones y solo imprimen el error, así que
+    además del código de salida se revisa la salida en busca del marcador.
+    """
+    if result.exit_code != 0 or result.exception is not None:
+        return True
+    return any(line.lstrip().startswith(CLI_ERROR_MARKERS) for line in result.output.splitlines())
+
+def run_cli_timings(commands=None, repeat=5):
+    """Cronometrar comandos de la CLI invocándolos en proceso"""
+    from kanban_app.cli import cli
+
+    runner = CliRunner()
+    results = {}
+    for args in commands or DEFAULT_CLI_COMMANDS:
+        samples = []
+        failures = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = runner.invoke(cli, args)
+            elapsed = time.perf_counter() - start
+            if _cli_failed(result):
+                failures += 1
+            else:
+                samples.append(elapsed)
+        results[' '.join(args)] = summarize(samples)
+        results[' '.join(args)]['errors'] = failures
+    return results
+
+def run_benchmark(requests=500, cli_repeat=5, mix=None, seed=42, workload=None):
+    """Ejecutar la suite completa y devolver un diccionario serializable a JSON"""
+    from kanban_app.web import create_app
+
+    # Sin ejecutor de trabajos: no debe retomar trabajos de los tableros reales
+    app = create_app(run_jobs=False)
+    app.config['TESTING'] = True
+
+    started = time.perf_counter()
+    api_results = run_api_load(app, requests=requests, mix=mix, seed=seed)
+    cli_results = run_cli_timings(repeat=cli_repeat)
+    total = time.perf_counter() - started
+
+    return {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat(),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'requests': requests,
+            'cli_repeat': cli_repeat,
+            'mix': mix or DEFAULT_MIX,
+            'workload': workload,
+        },
+        'api': api_results,
+        'cli': cli_results,
+        'total_seconds': round(total, 3),
+    }
+
+def write_results(results, path):
+    """Guardar los resultados en formato JSON para comparar entre commits"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,78 @@
+import random
+from datetime import datetime, timedelta
+from kanban_app.database import init_db, get_session
+from kanban_app.models import Task, Project, Assignee, TaskStatus, Priority
+
+# Reparto por defecto de estados en el tablero generado
+DEFAULT_STATUS_WEIGHTS = {
+    TaskStatus.PENDING: 0.3,
+    TaskStatus.IN_PROGRESS: 0.2,
+    TaskStatus.COMPLETED: 0.5,
+}
+
+def generate_workload(projects=10, assignees=20, tasks=1000, days=180, seed=42,
+                      status_weights=None, batch_size=500):
+    """Poblar la base de datos con proyectos, responsables y tareas sintéticos
+
+    La generación es determinista para una misma semilla, de modo que dos
+    ejecuciones sobre bases vacías producen exactamente los mismos datos.
+    """
+    rng = random.Random(seed)
+    weights = status_weights or DEFAULT_STATUS_WEIGHTS
+    statuses = list(weights.keys())
+    status_weights_list = [weights[s] for s in statuses]
+    priorities = list(Priority)
+    now = datetime.utcnow()
+
+    init_db()
+    db = get_session()
+    try:
+        # Proyectos y responsables con nombres únicos por semilla
+        project_rows = [
+            Project(name=f"Proyecto {seed}-{i}", description=f"Proyecto sintético {i}")
+            for i in range(projects)
+        ]
+        assignee_rows = [
+            Assignee(name=f"Responsable {seed}-{i}", email=f"user{seed}-{i}@example.com")
+            for i in range(assignees)
+        ]
+        db.add_all(project_rows + assignee_rows)
+        db.commit()
+
+        project_ids = [p.id for p in project_rows]
+        assignee_ids = [a.id for a in assignee_rows]
+
+        # Tareas en lotes para no mantener toda la carga en la sesión
+        created = 0
+        while created < tasks:
+            batch = []
+            for i in range(created, min(created + batch_size, tasks)):
+                created_at = now - timedelta(seconds=rng.randint(0, days * 86400))
+                updated_at = created_at + timedelta(
+                    seconds=rng.randint(0, int((now - created_at).total_seconds()))
+                )
+                batch.append({
+                    'title': f"Tarea sintética {i}",
+                    'description': f"Descripción generada para la tarea {i}",
+                    'project_id': rng.choice(project_ids) if project_ids else None,
+                    'assignee_id': rng.choice(assignee_ids) if assignee_ids else None,
+                    'priority': rng.choice(priorities),
+                    'status': rng.choices(statuses, weights=status_weights_list)[0],
+                    'created_at': created_at,
+                    'updated_at': updated_at,
+                })
+            db.bulk_insert_mappings(Task, batch)
+            db.commit()
+            created += len(batch)
+
+        return {
+            'projects': len(project_ids),
+            'assignees': len(assignee_ids),
+            'tasks': created,
+            'seed': seed,
+        }
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
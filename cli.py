@@ -1,17 +1,42 @@
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
 import click
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from kanban_app.database import init_db, get_session
-from kanban_app.models import Task, Project, Assignee, TaskStatus, Priority
+from kanban_app.database import (init_db, get_session, set_database_url, set_current_board,
+                                 get_current_board, registry, SQLALCHEMY_DATABASE_URL)
+from kanban_app.models import Task, ArchivedTask, Project, Assignee, TaskStatus, Priority
 
 console = Console()
 
 @click.group()
 @click.version_option(version="1.0.0")
-def cli():
+@click.option('--board', '-b', envvar='TASKFLOW_BOARD', help='Tablero sobre el que operar (por defecto kanban.db)')
+@click.pass_context
+def cli(ctx, board):
     """TaskFlow Kanban CLI - Gestión de tareas con tablero Kanban"""
-    pass
+    try:
+        if board is not None and not registry.exists(board) and ctx.invoked_subcommand != 'create-board':
+            raise click.BadParameter(f"Tablero no encontrado: '{board}' (usa create-board para crearlo)",
+                                     param_hint='--board')
+        set_current_board(board)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--board')
+
+def format_task_id(task):
+    """ID a mostrar: las tareas archivadas muestran su ID original marcado"""
+    if isinstance(task, ArchivedTask):
+        return f"{task.original_id} (archivada)"
+    return str(task.id)
+
+def reject_board(command):
+    """Abortar si se indicó --board en un comando que no trabaja sobre tableros"""
+    if get_current_board() is not None:
+        raise click.UsageError(f"El comando '{command}' no admite --board")
 
 @cli.command()
 def init():
@@ -136,7 +161,7 @@ def complete_task(task_id):
             return
         
         task.status = TaskStatus.COMPLETED
-        task.updated_at = Task.__table__.c.updated_at.default.arg
+        task.updated_at = datetime.utcnow()
         db.commit()
         
         console.print(f"[green]+ Tarea '{task.title}' marcada como completada[/green]")
@@ -208,21 +233,54 @@ def list_assignees():
     except Exception as e:
         console.print(f"[red]✗ Error al listar responsables: {e}[/red]")
 
+@cli.command()
+@click.argument('name')
+def create_board(name):
+    """Crear un tablero nuevo"""
+    try:
+        if registry.create_board(name):
+            console.print(f"[green]+ Tablero '{name}' creado[/green]")
+        else:
+            console.print(f"[yellow]* El tablero '{name}' ya existe[/yellow]")
+    except ValueError as e:
+        console.print(f"[red]✗ Error al crear el tablero: {e}[/red]")
+
+@cli.command()
+def list_boards():
+    """Listar los tableros existentes"""
+    boards = registry.list_boards()
+    
+    if not boards:
+        console.print("[yellow]No hay tableros registrados[/yellow]")
+        return
+    
+    table = Table(title="Tableros")
+    table.add_column("Nombre", style="green")
+    table.add_column("Archivo", style="white")
+    
+    for board in boards:
+        table.add_row(board, registry.database_url(board).replace('sqlite:///', ''))
+    
+    console.print(table)
+
 @cli.command()
 @click.option('--project', '-p', help='Filtrar por proyecto')
 @click.option('--assignee', '-a', help='Filtrar por responsable')
 @click.option('--status', '-s', type=click.Choice(['pending', 'inprogress', 'completed']), help='Filtrar por estado')
-def list_tasks(project, assignee, status):
+@click.option('--include-archived', is_flag=True, help='Incluir tareas archivadas')
+def list_tasks(project, assignee, status, include_archived):
     """Listar todas las tareas"""
     try:
         db = get_session()
         query = db.query(Task)
+        archived_query = db.query(ArchivedTask)
         
         # Aplicar filtros
         if project:
             proj = db.query(Project).filter(Project.name == project).first()
             if proj:
                 query = query.filter(Task.project_id == proj.id)
+                archived_query = archived_query.filter(ArchivedTask.project_id == proj.id)
             else:
                 console.print(f"[yellow]* Proyecto '{project}' no encontrado[/yellow]")
                 return
@@ -231,14 +289,18 @@ def list_tasks(project, assignee, status):
             assign = db.query(Assignee).filter(Assignee.name == assignee).first()
             if assign:
                 query = query.filter(Task.assignee_id == assign.id)
+                archived_query = archived_query.filter(ArchivedTask.assignee_id == assign.id)
             else:
                 console.print(f"[yellow]* Responsable '{assignee}' no encontrado[/yellow]")
                 return
         
         if status:
             query = query.filter(Task.status == TaskStatus(status))
+            archived_query = archived_query.filter(ArchivedTask.status == TaskStatus(status))
         
         tasks = query.all()
+        if include_archived:
+            tasks += archived_query.all()
         
         if not tasks:
             console.print("[yellow]No hay tareas que coincidan con los criterios[/yellow]")
@@ -254,7 +316,7 @@ def list_tasks(project, assignee, status):
         
         for task in tasks:
             table.add_row(
-                str(task.id),
+                format_task_id(task),
                 task.title,
                 task.project_name or "Sin proyecto",
                 task.assignee_name or "Sin asignar",
@@ -268,11 +330,14 @@ def list_tasks(project, assignee, status):
         console.print(f"[red]✗ Error al listar tareas: {e}[/red]")
 
 @cli.command()
-def kanban():
+@click.option('--include-archived', is_flag=True, help='Incluir tareas archivadas')
+def kanban(include_archived):
     """Mostrar tablero Kanban en consola"""
     try:
         db = get_session()
         tasks = db.query(Task).all()
+        if include_archived:
+            tasks += db.query(ArchivedTask).all()
         
         if not tasks:
             console.print("[yellow]No hay tareas para mostrar[/yellow]")
@@ -284,11 +349,11 @@ def kanban():
         completed = [t for t in tasks if t.status == TaskStatus.COMPLETED]
         
         # Crear paneles para cada columna
-        pending_panel = Panel("\n".join([f"[cyan]{t.id}[/cyan] {t.title}" for t in pending]) or "[i]No hay tareas[/i]", 
+        pending_panel = Panel("\n".join([f"[cyan]{format_task_id(t)}[/cyan] {t.title}" for t in pending]) or "[i]No hay tareas[/i]", 
                              title="Pendientes", style="red")
-        inprogress_panel = Panel("\n".join([f"[cyan]{t.id}[/cyan] {t.title}" for t in inprogress]) or "[i]No hay tareas[/i]", 
+        inprogress_panel = Panel("\n".join([f"[cyan]{format_task_id(t)}[/cyan] {t.title}" for t in inprogress]) or "[i]No hay tareas[/i]", 
                                title="En Progreso", style="blue")
-        completed_panel = Panel("\n".join([f"[cyan]{t.id}[/cyan] {t.title}" for t in completed]) or "[i]No hay tareas[/i]", 
+        completed_panel = Panel("\n".join([f"[cyan]{format_task_id(t)}[/cyan] {t.title}" for t in completed]) or "[i]No hay tareas[/i]", 
                               title="Completadas", style="green")
         
         # Mostrar tablero
@@ -301,5 +366,150 @@ def kanban():
     except Exception as e:
         console.print(f"[red]✗ Error al mostrar el tablero Kanban: {e}[/red]")
 
+@cli.command()
+@click.option('--days', '-d', default=30, show_default=True, help='Archivar tareas completadas hace más de N días')
+@click.option('--interval', type=int, help='Repetir cada N segundos (ejecución programada)')
+@click.option('--measure', is_flag=True, help='Medir filas y latencia de lectura antes y después')
+def archive(days, interval, measure):
+    """Mover las tareas completadas antiguas al archivo"""
+    try:
+        from kanban_app.archive import archive_completed_tasks, measure_hot_path
+
+        init_db()
+        while True:
+            # Un fallo en una pasada (p. ej. base de datos bloqueada) no detiene
+            # la ejecución programada: se informa y se reintenta en la siguiente
+            try:
+                db = get_session()
+                try:
+                    before = measure_hot_path(db) if measure else None
+                    count = archive_completed_tasks(db, days=days)
+                    after = measure_hot_path(db) if measure else None
+                finally:
+                    db.close()
+                
+                console.print(f"[green]+ {count} tareas archivadas (completadas hace más de {days} días)[/green]")
+                
+                if measure:
+                    table = Table(title="Tabla de tareas")
+                    table.add_column("", style="cyan")
+                    table.add_column("Antes", style="yellow")
+                    table.add_column("Después", style="green")
+                    table.add_row("Filas activas", str(before['rows']), str(after['rows']))
+                    table.add_row("Filas archivadas", str(before['archived_rows']), str(after['archived_rows']))
+                    table.add_row("Latencia lectura, mediana (ms)", str(before['latency_ms']), str(after['latency_ms']))
+                    console.print(table)
+            except Exception as e:
+                console.print(f"[red]✗ Error al archivar tareas: {e}[/red]")
+            
+            if not interval:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        console.print("[yellow]* Archivado programado detenido[/yellow]")
+    except Exception as e:
+        console.print(f"[red]✗ Error al archivar tareas: {e}[/red]")
+
+@cli.command()
+@click.option('--concurrency', '-c', default=2, show_default=True, help='Trabajos ejecutados en paralelo')
+@click.option('--poll-interval', default=1.0, show_default=True, help='Segundos entre consultas de trabajos pendientes')
+@click.option('--once', is_flag=True, help='Procesar los trabajos pendientes y salir')
+def worker(concurrency, poll_interval, once):
+    """Procesar los trabajos en segundo plano"""
+    try:
+        from kanban_app.jobs import worker_loop
+
+        init_db()
+        console.print("[green]+ Worker iniciado, esperando trabajos...[/green]")
+        processed = worker_loop(concurrency=concurrency, poll_interval=poll_interval, once=once)
+        console.print(f"[green]+ {processed} trabajos procesados[/green]")
+    except KeyboardInterrupt:
+        console.print("[yellow]* Worker detenido[/yellow]")
+    except Exception as e:
+        console.print(f"[red]✗ Error en el worker: {e}[/red]")
+
+@cli.command()
+@click.option('--projects', default=10, show_default=True, help='Número de proyectos a generar')
+@click.option('--assignees', default=20, show_default=True, help='Número de responsables a generar')
+@click.option('--tasks', default=1000, show_default=True, help='Número de tareas a generar')
+@click.option('--days', default=180, show_default=True, help='Antigüedad máxima de las tareas en días')
+@click.option('--seed', default=42, show_default=True, help='Semilla para datos reproducibles')
+@click.option('--database', help='Ruta a un archivo SQLite alternativo a kanban.db')
+def seed(projects, assignees, tasks, days, seed, database):
+    """Poblar la base de datos con datos sintéticos"""
+    reject_board('seed')
+    try:
+        from kanban_app.bench.generator import generate_workload
+
+        if database:
+            set_database_url(f"sqlite:///{os.path.abspath(database)}")
+        summary = generate_workload(projects=projects, assignees=assignees, tasks=tasks,
+                                    days=days, seed=seed)
+        console.print(f"[green]+ Generados {summary['projects']} proyectos, "
+                      f"{summary['assignees']} responsables y {summary['tasks']} tareas[/green]")
+    except Exception as e:
+        console.print(f"[red]✗ Error al generar datos: {e}[/red]")
+
+@cli.command()
+@click.option('--projects', default=10, show_default=True, help='Proyectos del tablero sintético')
+@click.option('--assignees', default=20, show_default=True, help='Responsables del tablero sintético')
+@click.option('--tasks', default=1000, show_default=True, help='Tareas del tablero sintético')
+@click.option('--requests', '-n', default=500, show_default=True, help='Peticiones a la API a reproducir')
+@click.option('--cli-repeat', default=5, show_default=True, help='Repeticiones de cada comando CLI')
+@click.option('--seed', default=42, show_default=True, help='Semilla para datos y mezcla de peticiones')
+@click.option('--database', help='Medir sobre una copia de un archivo SQLite existente en lugar de generar datos')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Guardar los resultados en JSON')
+def benchmark(projects, assignees, tasks, requests, cli_repeat, seed, database, output):
+    """Ejecutar el benchmark de extremo a extremo (API web y CLI)"""
+    reject_board('benchmark')
+    try:
+        from kanban_app.bench.generator import generate_workload
+        from kanban_app.bench.driver import run_benchmark, write_results
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Siempre se trabaja sobre una base temporal: el driver crea y mueve
+            # tareas, así que un archivo existente se copia antes de medir
+            workload = None
+            bench_path = os.path.join(tmpdir, 'bench.db')
+            try:
+                if database:
+                    shutil.copyfile(os.path.abspath(database), bench_path)
+                set_database_url(f"sqlite:///{bench_path}")
+                if not database:
+                    workload = generate_workload(projects=projects, assignees=assignees,
+                                                 tasks=tasks, seed=seed)
+
+                results = run_benchmark(requests=requests, cli_repeat=cli_repeat,
+                                        seed=seed, workload=workload)
+            finally:
+                set_database_url(SQLALCHEMY_DATABASE_URL)
+
+        table = Table(title="Benchmark")
+        table.add_column("Operación", style="cyan")
+        table.add_column("N", style="white")
+        table.add_column("Media (ms)", style="green")
+        table.add_column("p50 (ms)", style="green")
+        table.add_column("p95 (ms)", style="yellow")
+        table.add_column("Errores", style="red")
+
+        for group in ('api', 'cli'):
+            for name, stats in results[group].items():
+                table.add_row(
+                    f"{group}: {name}",
+                    str(stats['count']),
+                    str(stats.get('mean_ms', '-')),
+                    str(stats.get('p50_ms', '-')),
+                    str(stats.get('p95_ms', '-')),
+                    str(stats['errors'])
+                )
+
+        console.print(table)
+
+        if output:
+            write_results(results, output)
+            console.print(f"[green]+ Resultados guardados en {output}[/green]")
+    except Exception as e:
+        console.print(f"[red]✗ Error al ejecutar el benchmark: {e}[/red]")
+
 if __name__ == '__main__':
     cli()
\ No newline at end of file
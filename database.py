@@ -1,4 +1,8 @@
 import os
+import re
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -10,15 +14,166 @@ basedir = os.path.abspath(os.path.dirname(__file__))
 # URL de la base de datos
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(basedir, 'kanban.db')}"
 
+# Directorio con un archivo SQLite por tablero
+BOARDS_DIR = os.path.join(basedir, 'boards')
+
+# Nombres de tablero permitidos (se usan como nombre de archivo)
+BOARD_NAME_RE = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
 # Crear el motor de la base de datos
 engine = create_engine(SQLALCHEMY_DATABASE_URL, echo=False)
 
 # Crear la sesión
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Tablero activo en el contexto actual (None = base de datos por defecto)
+_current_board = ContextVar('current_board', default=None)
+
+def create_schema(bind):
+    """Crear tablas e índices que falten
+
+    `create_all` no modifica tablas existentes, así que los índices añadidos
+    después se crean aparte para que las bases antiguas también los tengan.
+    """
+    Base.metadata.create_all(bind=bind)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+class BoardNotFoundError(LookupError):
+    """El tablero solicitado no existe"""
+
+def validate_board_name(board):
+    """Comprobar que el nombre del tablero es seguro como nombre de archivo"""
+    if not board or not BOARD_NAME_RE.fullmatch(board):
+        raise ValueError(f"Nombre de tablero inválido: '{board}'")
+    return board
+
+class EngineRegistry:
+    """Registro de motores por tablero con expulsión LRU de los inactivos
+
+    Cada tablero tiene su propio archivo SQLite, de modo que las escrituras
+    de distintos equipos no se bloquean entre sí. Solo se mantienen abiertos
+    los `max_engines` motores usados más recientemente.
+    """
+    
+    def __init__(self, boards_dir=BOARDS_DIR, max_engines=32):
+        self.boards_dir = boards_dir
+        self.max_engines = max_engines
+        self._engines = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def database_path(self, board):
+        """Ruta del archivo SQLite de un tablero"""
+        validate_board_name(board)
+        return os.path.join(self.boards_dir, board + '.db')
+    
+    def database_url(self, board):
+        """URL de la base de datos de un tablero"""
+        return f"sqlite:///{self.database_path(board)}"
+    
+    def exists(self, board):
+        """Comprobar si un tablero ya ha sido creado"""
+        return board in self._engines or os.path.isfile(self.database_path(board))
+    
+    def create_board(self, board):
+        """Crear explícitamente un tablero nuevo; devuelve False si ya existía"""
+        if self.exists(board):
+            return False
+        os.makedirs(self.boards_dir, exist_ok=True)
+        self.get_engine(board, create=True)
+        return True
+    
+    def get_engine(self, board, create=False):
+        """Obtener el motor de un tablero y marcarlo como usado
+
+        Los tableros solo se crean con `create=True`; un nombre desconocido
+        lanza BoardNotFoundError para no crear tableros vacíos por erratas.
+        """
+        with self._lock:
+            board_engine = self._engines.get(board)
+            if board_engine is not None:
+                self._engines.move_to_end(board)
+                return board_engine
+            
+            if not create and not os.path.isfile(self.database_path(board)):
+                raise BoardNotFoundError(f"Tablero no encontrado: '{board}'")
+            
+            board_engine = create_engine(self.database_url(board), echo=False)
+            create_schema(board_engine)
+            self._engines[board] = board_engine
+            
+            # Expulsar los motores menos usados recientemente
+            while len(self._engines) > self.max_engines:
+                _, evicted = self._engines.popitem(last=False)
+                evicted.dispose()
+            
+            return board_engine
+    
+    def evict(self, board):
+        """Cerrar el motor de un tablero si está abierto"""
+        with self._lock:
+            board_engine = self._engines.pop(board, None)
+        if board_engine is not None:
+            board_engine.dispose()
+    
+    def dispose_all(self):
+        """Cerrar todos los motores abiertos"""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+        for board_engine in engines:
+            board_engine.dispose()
+    
+    def list_boards(self):
+        """Tableros existentes en disco"""
+        if not os.path.isdir(self.boards_dir):
+            return []
+        return sorted(
+            name[:-3] for name in os.listdir(self.boards_dir)
+            if name.endswith('.db') and BOARD_NAME_RE.fullmatch(name[:-3])
+        )
+    
+    def __len__(self):
+        return len(self._engines)
+
+# Registro global de motores por tablero; el límite de motores abiertos es
+# compartido por todo el proceso y se configura al arrancar
+registry = EngineRegistry(max_engines=int(os.environ.get('TASKFLOW_MAX_ENGINES', 32)))
+
+def set_database_url(url):
+    """Apuntar la aplicación a otra base de datos (p. ej. para benchmarks)"""
+    global engine, SQLALCHEMY_DATABASE_URL
+    engine.dispose()
+    SQLALCHEMY_DATABASE_URL = url
+    engine = create_engine(url, echo=False)
+    SessionLocal.configure(bind=engine)
+    return engine
+
+def set_current_board(board):
+    """Activar un tablero en el contexto actual; devuelve un token para restaurarlo"""
+    if board is not None:
+        validate_board_name(board)
+    return _current_board.set(board)
+
+def reset_current_board(token):
+    """Restaurar el tablero activo anterior"""
+    _current_board.reset(token)
+
+def get_current_board():
+    """Tablero activo en el contexto actual"""
+    return _current_board.get()
+
+def get_engine():
+    """Motor del tablero activo o el motor por defecto"""
+    board = _current_board.get()
+    if board is None:
+        return engine
+    return registry.get_engine(board)
+
 def get_db():
     """Obtener una sesión de base de datos"""
-    db = SessionLocal()
+    db = get_session()
     try:
         yield db
     finally:
@@ -26,8 +181,11 @@ def get_db():
 
 def init_db():
     """Inicializar la base de datos"""
-    Base.metadata.create_all(bind=engine)
+    create_schema(get_engine())
 
 def get_session():
     """Obtener una sesión de base de datos"""
-    return SessionLocal()
\ No newline at end of file
+    board = _current_board.get()
+    if board is None:
+        return SessionLocal()
+    return SessionLocal(bind=registry.get_engine(board))
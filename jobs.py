@@ -0,0 +1,295 @@
+import contextvars
+import json
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from kanban_app.database import (basedir, get_session, set_current_board,
+                                 reset_current_board, get_current_board, registry)
+from kanban_app.models import Job, JobStatus, Task
+
+# Directorio donde se escriben las exportaciones
+EXPORTS_DIR = os.path.join(basedir, 'exports')
+
+# Un trabajo en ejecución sin señal de vida durante este tiempo se da por perdido
+JOB_STALE_AFTER = timedelta(minutes=10)
+
+# Cada cuánto se renueva la señal de vida de un trabajo en ejecución (segundos)
+JOB_HEARTBEAT_INTERVAL = 30
+
+# Registro de tipos de trabajo: nombre -> función(params, progress)
+JOB_HANDLERS = {}
+
+def job_handler(name):
+    """Registrar una función como manejador de un tipo de trabajo"""
+    def decorator(func):
+        JOB_HANDLERS[name] = func
+        return func
+    return decorator
+
+def enqueue_job(db, job_type, params=None):
+    """Crear un trabajo pendiente en la base de datos"""
+    if job_type not in JOB_HANDLERS:
+        raise ValueError(f"Tipo de trabajo desconocido: '{job_type}'")
+    
+    job = Job(type=job_type, params=json.dumps(params or {}), status=JobStatus.PENDING)
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+def claim_job(db, job_id):
+    """Marcar un trabajo como en ejecución si sigue pendiente
+
+    La actualización es condicional, así que si varios workers intentan
+    reclamar el mismo trabajo solo uno lo consigue.
+    """
+    now = datetime.utcnow()
+    claimed = db.query(Job).filter(Job.id == job_id, Job.status == JobStatus.PENDING).update(
+        {Job.status: JobStatus.RUNNING, Job.started_at: now, Job.updated_at: now},
+        synchronize_session=False
+    )
+    db.commit()
+    return claimed == 1
+
+def recover_stale_jobs(db, stale_after=JOB_STALE_AFTER):
+    """Devolver a la cola los trabajos en ejecución sin avances recientes
+
+    Un proceso que muere a mitad de un trabajo lo deja en ejecución para
+    siempre; si no ha informado de avances en `stale_after` se considera
+    perdido y se vuelve a encolar. Devuelve el número de trabajos recuperados.
+    """
+    cutoff = datetime.utcnow() - stale_after
+    recovered = db.query(Job).filter(Job.status == JobStatus.RUNNING, Job.updated_at < cutoff).update(
+        {Job.status: JobStatus.PENDING, Job.started_at: None, Job.progress: 0,
+         Job.message: 'Reencolado tras una interrupción'},
+        synchronize_session=False
+    )
+    db.commit()
+    return recovered
+
+def _update_job(job_id, started_at, values):
+    """Actualizar un trabajo en su propia transacción
+
+    Solo se modifica si sigue en ejecución por la misma reclamación
+    (`started_at`): si se reencoló y otro worker lo tomó, la ejecución
+    original ya no puede sobrescribir su estado. Devuelve True si se actualizó.
+    """
+    values = dict(values)
+    values[Job.updated_at] = datetime.utcnow()
+    db = get_session()
+    try:
+        updated = db.query(Job).filter(
+            Job.id == job_id, Job.status == JobStatus.RUNNING, Job.started_at == started_at
+        ).update(values, synchronize_session=False)
+        db.commit()
+        return updated == 1
+    finally:
+        db.close()
+
+def _heartbeat(job_id, started_at, stop):
+    """Renovar la señal de vida del trabajo hasta que termine, informe o no del avance"""
+    while not stop.wait(JOB_HEARTBEAT_INTERVAL):
+        try:
+            if not _update_job(job_id, started_at, {}):
+                return
+        except Exception:
+            traceback.print_exc()
+
+def run_job(job_id):
+    """Ejecutar un trabajo pendiente; devuelve False si otro worker lo reclamó"""
+    db = get_session()
+    try:
+        if not claim_job(db, job_id):
+            return False
+        job = db.query(Job).filter(Job.id == job_id).first()
+        job_type = job.type
+        params = json.loads(job.params) if job.params else {}
+        started_at = job.started_at
+    finally:
+        db.close()
+    
+    def progress(done, total=100, message=None):
+        """Informar del avance del trabajo (porcentaje y mensaje opcional)"""
+        percent = int(done * 100 / total) if total else 100
+        values = {Job.progress: max(0, min(percent, 100))}
+        if message is not None:
+            values[Job.message] = message
+        _update_job(job_id, started_at, values)
+    
+    # La señal de vida no depende de que el manejador informe del avance;
+    # el hilo hereda el contexto para escribir en el tablero del trabajo
+    stop = threading.Event()
+    heartbeat = threading.Thread(
+        target=contextvars.copy_context().run, args=(_heartbeat, job_id, started_at, stop),
+        name=f'taskflow-job-{job_id}-heartbeat', daemon=True
+    )
+    heartbeat.start()
+    
+    try:
+        result = JOB_HANDLERS[job_type](params, progress)
+        _update_job(job_id, started_at, {
+            Job.status: JobStatus.COMPLETED,
+            Job.progress: 100,
+            Job.result: json.dumps(result),
+            Job.finished_at: datetime.utcnow()
+        })
+    except Exception as e:
+        traceback.print_exc()
+        _update_job(job_id, started_at, {
+            Job.status: JobStatus.FAILED,
+            Job.error: str(e),
+            Job.finished_at: datetime.utcnow()
+        })
+    finally:
+        stop.set()
+        heartbeat.join()
+    return True
+
+def pending_job_ids(db, limit=10):
+    """IDs de los trabajos pendientes más antiguos"""
+    query = db.query(Job.id).filter(Job.status == JobStatus.PENDING).order_by(Job.id)
+    if limit is not None:
+        query = query.limit(limit)
+    rows = query.all()
+    return [row[0] for row in rows]
+
+class JobRunner:
+    """Ejecutor en proceso de trabajos con un pool de hilos
+
+    Cada trabajo se ejecuta sobre el tablero activo en el momento de
+    encolarlo, de modo que las peticiones web devuelven la respuesta de
+    inmediato y el trabajo pesado queda fuera del hilo de la petición.
+    """
+    
+    def __init__(self, max_workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='taskflow-job')
+    
+    def submit(self, job_id, board=None):
+        """Programar la ejecución de un trabajo ya persistido"""
+        return self.executor.submit(self._run, job_id, board)
+    
+    def _run(self, job_id, board):
+        token = set_current_board(board)
+        try:
+            return run_job(job_id)
+        finally:
+            reset_current_board(token)
+    
+    def resume(self, stale_after=JOB_STALE_AFTER):
+        """Recuperar los trabajos perdidos y programar los pendientes de todos los tableros
+
+        Los trabajos encolados solo viven en memoria hasta que se ejecutan, así
+        que al arrancar se vuelven a leer de la base de datos.
+        """
+        submitted = 0
+        for board in [None] + registry.list_boards():
+            token = set_current_board(board)
+            try:
+                db = get_session()
+                try:
+                    recover_stale_jobs(db, stale_after)
+                    job_ids = pending_job_ids(db, limit=None)
+                finally:
+                    db.close()
+            except Exception:
+                traceback.print_exc()
+                continue
+            finally:
+                reset_current_board(token)
+            
+            for job_id in job_ids:
+                self.submit(job_id, board)
+            submitted += len(job_ids)
+        return submitted
+    
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+def worker_loop(concurrency=2, poll_interval=1.0, once=False, stale_after=JOB_STALE_AFTER):
+    """Procesar los trabajos pendientes del tablero activo hasta interrumpir"""
+    runner = JobRunner(max_workers=concurrency)
+    board = get_current_board()
+    processed = 0
+    try:
+        while True:
+            # Un error puntual (p. ej. base de datos bloqueada) no detiene el worker
+            try:
+                db = get_session()
+                try:
+                    recover_stale_jobs(db, stale_after)
+                    job_ids = pending_job_ids(db, limit=concurrency)
+                finally:
+                    db.close()
+            except Exception:
+                traceback.print_exc()
+                if once:
+                    break
+                time.sleep(poll_interval)
+                continue
+            
+            futures = [runner.submit(job_id, board) for job_id in job_ids]
+            for future in futures:
+                try:
+                    if future.result():
+                        processed += 1
+                except Exception:
+                    traceback.print_exc()
+            
+            if not job_ids:
+                if once:
+                    break
+                time.sleep(poll_interval)
+    finally:
+        runner.shutdown()
+    return processed
+
+@job_handler('archive')
+def archive_job(params, progress):
+    """Archivar las tareas completadas antiguas"""
+    from kanban_app.archive import archive_completed_tasks
+    
+    days = int(params.get('days', 30))
+    progress(0, message=f"Archivando tareas completadas hace más de {days} días")
+    db = get_session()
+    try:
+        count = archive_completed_tasks(db, days=days)
+    finally:
+        db.close()
+    return {'archived': count}
+
+@job_handler('export_tasks')
+def export_tasks_job(params, progress, batch_size=500):
+    """Exportar las tareas a un archivo JSON"""
+    db = get_session()
+    try:
+        total = db.query(Task).count()
+        os.makedirs(EXPORTS_DIR, exist_ok=True)
+        board = get_current_board() or 'default'
+        filename = f"{board}-tasks-{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}.json"
+        path = os.path.join(EXPORTS_DIR, filename)
+        
+        exported = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[')
+            last_id = 0
+            while True:
+                # Paginación por clave para no cargar todo el tablero en memoria
+                batch = db.query(Task).filter(Task.id > last_id) \
+                    .order_by(Task.id).limit(batch_size).all()
+                if not batch:
+                    break
+                for task in batch:
+                    if exported:
+                        f.write(',')
+                    json.dump(task.to_dict(), f, ensure_ascii=False)
+                    exported += 1
+                last_id = batch[-1].id
+                db.expunge_all()
+                progress(exported, total, message=f"{exported}/{total} tareas exportadas")
+            f.write(']')
+    finally:
+        db.close()
+    return {'path': path, 'tasks': exported}
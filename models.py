@@ -3,6 +3,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
+import json
 
 Base = declarative_base()
 
@@ -16,6 +17,12 @@ class Priority(enum.Enum):
     MEDIUM = "medium"
     HIGH = "high"
 
+class JobStatus(enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
 class Project(Base):
     __tablename__ = 'projects'
     
@@ -56,6 +63,8 @@ class Assignee(Base):
 
 class Task(Base):
     __tablename__ = 'tasks'
+    # Evitar que SQLite reutilice IDs de tareas movidas al archivo
+    __table_args__ = {'sqlite_autoincrement': True}
     
     id = Column(Integer, primary_key=True)
     title = Column(String(200), nullable=False)
@@ -65,7 +74,7 @@ class Task(Base):
     priority = Column(Enum(Priority), default=Priority.MEDIUM)
     status = Column(Enum(TaskStatus), default=TaskStatus.PENDING)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relaciones
     project_obj = relationship("Project", back_populates="tasks")
@@ -92,4 +101,85 @@ class Task(Base):
             'status': self.status.value if self.status else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class ArchivedTask(Base):
+    """Tarea completada movida fuera de la tabla principal (almacenamiento frío)"""
+    __tablename__ = 'archived_tasks'
+    
+    # Clave propia: SQLite puede reutilizar IDs de tareas en bases antiguas,
+    # así que el ID original se guarda aparte y puede repetirse
+    id = Column(Integer, primary_key=True)
+    original_id = Column(Integer, nullable=False, index=True)
+    title = Column(String(200), nullable=False)
+    description = Column(Text)
+    project_id = Column(Integer, ForeignKey('projects.id'))
+    assignee_id = Column(Integer, ForeignKey('assignees.id'))
+    priority = Column(Enum(Priority), default=Priority.MEDIUM)
+    status = Column(Enum(TaskStatus), default=TaskStatus.COMPLETED)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow, index=True)
+    
+    # Relaciones (solo lectura)
+    project_obj = relationship("Project", viewonly=True)
+    assignee_obj = relationship("Assignee", viewonly=True)
+    
+    @property
+    def project_name(self):
+        return self.project_obj.name if self.project_obj else None
+    
+    @property
+    def assignee_name(self):
+        return self.assignee_obj.name if self.assignee_obj else None
+    
+    def to_dict(self):
+        return {
+            'id': self.original_id,
+            'archive_id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'project_id': self.project_id,
+            'project_name': self.project_name,
+            'assignee_id': self.assignee_id,
+            'assignee_name': self.assignee_name,
+            'priority': self.priority.value if self.priority else None,
+            'status': self.status.value if self.status else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'archived_at': self.archived_at.isoformat() if self.archived_at else None
+        }
+
+class Job(Base):
+    """Trabajo en segundo plano (importaciones, exportaciones, informes...)"""
+    __tablename__ = 'jobs'
+    
+    id = Column(Integer, primary_key=True)
+    type = Column(String(50), nullable=False)
+    params = Column(Text)
+    status = Column(Enum(JobStatus), default=JobStatus.PENDING, index=True)
+    progress = Column(Integer, default=0)
+    message = Column(Text)
+    result = Column(Text)
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    # Última señal de vida: se actualiza al reclamar el trabajo y con cada avance
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'type': self.type,
+            'params': json.loads(self.params) if self.params else {},
+            'status': self.status.value if self.status else None,
+            'progress': self.progress,
+            'message': self.message,
+            'result': json.loads(self.result) if self.result else None,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
         }
\ No newline at end of file
@@ -0,0 +1,45 @@
+import os
+import sys
+import pytest
+
+# El paquete se importa como `kanban_app`: añadir su directorio padre al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from kanban_app import database
+from kanban_app.database import init_db, get_session, set_database_url, set_current_board, reset_current_board
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Base de datos y directorio de tableros temporales para cada test"""
+    original_url = database.SQLALCHEMY_DATABASE_URL
+    original_boards_dir = database.registry.boards_dir
+    
+    path = tmp_path / 'kanban.db'
+    set_database_url(f"sqlite:///{path}")
+    database.registry.dispose_all()
+    database.registry.boards_dir = str(tmp_path / 'boards')
+    token = set_current_board(None)
+    init_db()
+    
+    yield path
+    
+    reset_current_board(token)
+    database.registry.dispose_all()
+    database.registry.boards_dir = original_boards_dir
+    set_database_url(original_url)
+
+@pytest.fixture
+def db(db_path):
+    """Sesión sobre la base de datos temporal"""
+    session = get_session()
+    yield session
+    session.close()
+
+@pytest.fixture
+def client(db_path):
+    """Cliente de test de Flask sin ejecutor de trabajos en segundo plano"""
+    from kanban_app.web import create_app
+    
+    app = create_app(run_jobs=False)
+    app.config['TESTING'] = True
+    return app.test_client()
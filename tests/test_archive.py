@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+from kanban_app.archive import archive_completed_tasks
+from kanban_app.models import Task, ArchivedTask, Project, TaskStatus
+
+def make_task(db, title, status, age_days, **kwargs):
+    """Crear una tarea modificada por última vez hace `age_days` días"""
+    stamp = datetime.utcnow() - timedelta(days=age_days)
+    task = Task(title=title, status=status, created_at=stamp, updated_at=stamp, **kwargs)
+    db.add(task)
+    db.commit()
+    return task
+
+def test_archive_moves_only_old_completed_tasks(db):
+    old = make_task(db, 'vieja', TaskStatus.COMPLETED, 40)
+    make_task(db, 'reciente', TaskStatus.COMPLETED, 5)
+    make_task(db, 'pendiente', TaskStatus.PENDING, 40)
+    old_id = old.id
+    
+    assert archive_completed_tasks(db, days=30) == 1
+    
+    assert sorted(t.title for t in db.query(Task).all()) == ['pendiente', 'reciente']
+    archived = db.query(ArchivedTask).one()
+    assert archived.original_id == old_id
+    assert archived.title == 'vieja'
+    assert archived.archived_at is not None
+    assert archive_completed_tasks(db, days=30) == 0
+
+def test_archive_tolerates_reused_task_ids(db):
+    # Las bases antiguas sin AUTOINCREMENT reutilizan el ID de la última tarea
+    first = make_task(db, 'primera', TaskStatus.COMPLETED, 40)
+    task_id = first.id
+    assert archive_completed_tasks(db, days=30) == 1
+    
+    make_task(db, 'reutilizada', TaskStatus.COMPLETED, 40, id=task_id)
+    assert archive_completed_tasks(db, days=30) == 1
+    
+    archived = db.query(ArchivedTask).order_by(ArchivedTask.id).all()
+    assert [a.original_id for a in archived] == [task_id, task_id]
+    assert [a.title for a in archived] == ['primera', 'reutilizada']
+
+def test_include_archived_in_api(db, client):
+    project = Project(name='Web')
+    db.add(project)
+    db.commit()
+    make_task(db, 'archivada', TaskStatus.COMPLETED, 40, project_id=project.id)
+    make_task(db, 'activa', TaskStatus.PENDING, 1, project_id=project.id)
+    make_task(db, 'otra', TaskStatus.COMPLETED, 40)
+    archive_completed_tasks(db, days=30)
+    
+    default = client.get('/api/tasks').get_json()
+    assert [t['title'] for t in default] == ['activa']
+    
+    everything = client.get('/api/tasks?include_archived=true').get_json()
+    assert sorted(t['title'] for t in everything) == ['activa', 'archivada', 'otra']
+    archived = [t for t in everything if t['title'] == 'archivada'][0]
+    assert archived['archived_at'] is not None
+    assert archived['project_name'] == 'Web'
+    
+    filtered = client.get('/api/tasks?include_archived=1&project=Web').get_json()
+    assert sorted(t['title'] for t in filtered) == ['activa', 'archivada']
+
+def test_archive_skips_tasks_changed_after_selection(db, monkeypatch):
+    reopened = make_task(db, 'reabierta', TaskStatus.COMPLETED, 40)
+    make_task(db, 'vieja', TaskStatus.COMPLETED, 40)
+    reopened_id = reopened.id
+    original_execute = db.execute
+    
+    def execute_and_reopen(statement, *args, **kwargs):
+        result = original_execute(statement, *args, **kwargs)
+        # Tras la selección de IDs, otra petición reabre la tarea
+        if statement.is_select and not getattr(execute_and_reopen, 'done', False):
+            execute_and_reopen.done = True
+            original_execute(
+                Task.__table__.update().where(Task.id == reopened_id)
+                .values(status=TaskStatus.PENDING, updated_at=datetime.utcnow())
+            )
+        return result
+    
+    monkeypatch.setattr(db, 'execute', execute_and_reopen)
+    assert archive_completed_tasks(db, days=30) == 1
+    
+    assert [t.title for t in db.query(Task).all()] == ['reabierta']
+    assert [a.title for a in db.query(ArchivedTask).all()] == ['vieja']
+
+def test_cli_shows_original_id_for_archived_tasks(db):
+    from click.testing import CliRunner
+    from kanban_app.cli import cli
+    
+    # El ID original (6) difiere de la clave del archivo (1)
+    make_task(db, 'archivada', TaskStatus.COMPLETED, 40, id=6)
+    make_task(db, 'activa', TaskStatus.PENDING, 1, id=1)
+    archive_completed_tasks(db, days=30)
+    
+    runner = CliRunner()
+    board = runner.invoke(cli, ['kanban', '--include-archived']).output
+    assert "6 (archivada) archivada" in board
+    assert "1 activa" in board
+    listing = runner.invoke(cli, ['list-tasks', '--include-archived']).output
+    assert "(archivada)" in listing
+    assert listing.count("│ 1 ") == 1
+
+def test_scheduled_archive_survives_errors(db, monkeypatch):
+    from click.testing import CliRunner
+    from kanban_app import archive, cli as cli_module
+    
+    calls = []
+    
+    def flaky_archive(session, days=30):
+        calls.append(days)
+        if len(calls) == 1:
+            raise RuntimeError('database is locked')
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        return 0
+    
+    monkeypatch.setattr(archive, 'archive_completed_tasks', flaky_archive)
+    monkeypatch.setattr(cli_module.time, 'sleep', lambda seconds: None)
+    result = CliRunner().invoke(cli_module.cli, ['archive', '--interval', '1'])
+    
+    assert len(calls) == 3
+    assert 'database is locked' in result.output
+    assert '0 tareas archivadas' in result.output
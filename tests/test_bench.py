@@ -0,0 +1,88 @@
+import pytest
+from click.testing import CliRunner
+from kanban_app.bench import driver
+from kanban_app.bench.driver import _cli_failed, _percentile, run_api_load, summarize
+from kanban_app.bench.generator import generate_workload
+from kanban_app.database import get_session, init_db, set_database_url
+from kanban_app.models import Task, Project, Assignee
+
+def task_rows():
+    """Contenido de las tareas sin las fechas, que dependen del momento actual"""
+    db = get_session()
+    try:
+        return [
+            (t.id, t.title, t.project_id, t.assignee_id, t.priority, t.status)
+            for t in db.query(Task).order_by(Task.id).all()
+        ]
+    finally:
+        db.close()
+
+def test_generator_counts(db):
+    summary = generate_workload(projects=3, assignees=4, tasks=25, seed=7, batch_size=10)
+    
+    assert summary == {'projects': 3, 'assignees': 4, 'tasks': 25, 'seed': 7}
+    assert db.query(Project).count() == 3
+    assert db.query(Assignee).count() == 4
+    assert db.query(Task).count() == 25
+
+def test_generator_is_deterministic(db_path, tmp_path):
+    generate_workload(projects=3, assignees=4, tasks=30, seed=7)
+    first = task_rows()
+    
+    set_database_url(f"sqlite:///{tmp_path / 'segunda.db'}")
+    init_db()
+    generate_workload(projects=3, assignees=4, tasks=30, seed=7)
+    assert task_rows() == first
+    
+    set_database_url(f"sqlite:///{tmp_path / 'tercera.db'}")
+    init_db()
+    generate_workload(projects=3, assignees=4, tasks=30, seed=8)
+    assert task_rows() != first
+
+def test_percentile_and_summarize():
+    samples = [0.001 * i for i in range(1, 101)]
+    
+    assert _percentile([5, 1, 3], 50) == 3
+    assert _percentile([5, 1, 3], 100) == 5
+    assert _percentile([5, 1, 3], 0) == 1
+    
+    stats = summarize(samples)
+    assert stats['count'] == 100
+    assert stats['mean_ms'] == pytest.approx(50.5)
+    assert stats['p50_ms'] == pytest.approx(50.0)
+    assert stats['p95_ms'] == pytest.approx(95.0)
+    assert stats['p99_ms'] == pytest.approx(99.0)
+    assert stats['max_ms'] == pytest.approx(100.0)
+    assert summarize([]) == {'count': 0}
+
+def test_cli_failed_detection(db_path, tmp_path):
+    from kanban_app.cli import cli
+    
+    runner = CliRunner()
+    assert not _cli_failed(runner.invoke(cli, ['kanban']))
+    
+    # Código de salida distinto de cero (comando inexistente)
+    assert _cli_failed(runner.invoke(cli, ['no-existe']))
+    
+    # El comando captura el error y sale con 0, pero imprime el marcador
+    set_database_url(f"sqlite:///{tmp_path / 'sin_tablas.db'}")
+    result = runner.invoke(cli, ['list-tasks'])
+    assert result.exit_code == 0
+    assert '✗' in result.output
+    assert _cli_failed(result)
+
+def test_run_api_load_counts_errors(db, monkeypatch):
+    from kanban_app.web import create_app
+    
+    generate_workload(projects=2, assignees=2, tasks=5, seed=1)
+    app = create_app(run_jobs=False)
+    
+    # Mover tareas inexistentes devuelve 404 y debe contarse como error
+    monkeypatch.setattr(driver, '_board_snapshot', lambda: (['Proyecto 1-0'], ['Responsable 1-0'], [9999]))
+    results = run_api_load(app, requests=20, mix={'move_task': 1, 'list_tasks': 1}, seed=3)
+    
+    moves = results['move_task']
+    lists = results['list_tasks']
+    assert moves['errors'] > 0 and moves['count'] == 0
+    assert lists['errors'] == 0 and lists['count'] > 0
+    assert moves['errors'] + lists['count'] == 20
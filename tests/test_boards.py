@@ -0,0 +1,90 @@
+import os
+import pytest
+from click.testing import CliRunner
+from kanban_app.cli import cli
+from kanban_app.database import (EngineRegistry, BoardNotFoundError, registry, validate_board_name,
+                                 get_session, set_current_board, reset_current_board)
+from kanban_app.models import Task
+
+@pytest.mark.parametrize('name', ['equipo-a', 'team_1', 'A' * 64])
+def test_valid_board_names(name):
+    assert validate_board_name(name) == name
+
+@pytest.mark.parametrize('name', ['', 'evil\n', '../x', 'a/b', 'a.b', 'A' * 65, None])
+def test_invalid_board_names(name):
+    with pytest.raises(ValueError):
+        validate_board_name(name)
+
+def test_registry_evicts_least_recently_used(tmp_path):
+    boards = EngineRegistry(boards_dir=str(tmp_path), max_engines=2)
+    for name in ('a', 'b', 'c'):
+        boards.create_board(name)
+    assert list(boards._engines) == ['b', 'c']
+    
+    # Usar 'b' lo convierte en el más reciente: el siguiente en salir es 'c'
+    boards.get_engine('b')
+    boards.get_engine('a')
+    assert list(boards._engines) == ['b', 'a']
+    assert len(boards) == 2
+    assert boards.list_boards() == ['a', 'b', 'c']
+    boards.dispose_all()
+
+def test_registry_does_not_create_unknown_boards(tmp_path):
+    boards = EngineRegistry(boards_dir=str(tmp_path / 'boards'))
+    with pytest.raises(BoardNotFoundError):
+        boards.get_engine('errata')
+    assert not boards.exists('errata')
+    assert not os.path.exists(tmp_path / 'boards')
+
+def test_unknown_board_returns_404(client):
+    assert client.get('/api/tasks?board=errata').status_code == 404
+    assert client.get('/api/tasks', headers={'X-Board': 'errata'}).status_code == 404
+    assert client.get('/api/tasks?board=evil%0A').status_code == 400
+    assert registry.list_boards() == []
+    assert not os.path.exists(registry.boards_dir)
+
+def test_boards_are_isolated(client):
+    assert client.post('/api/boards', json={'name': 'equipo-a'}).status_code == 201
+    assert client.post('/api/boards', json={'name': 'equipo-a'}).status_code == 409
+    
+    client.post('/api/tasks', json={'title': 'del tablero'}, headers={'X-Board': 'equipo-a'})
+    client.post('/api/tasks', json={'title': 'por defecto'})
+    
+    board_tasks = client.get('/api/tasks?board=equipo-a').get_json()
+    default_tasks = client.get('/api/tasks').get_json()
+    assert [t['title'] for t in board_tasks] == ['del tablero']
+    assert [t['title'] for t in default_tasks] == ['por defecto']
+    assert client.get('/api/boards').get_json()['boards'] == ['equipo-a']
+
+def test_cli_requires_existing_board(db_path):
+    runner = CliRunner()
+    result = runner.invoke(cli, ['--board', 'errata', 'kanban'])
+    assert result.exit_code != 0
+    assert 'Tablero no encontrado' in result.output
+    
+    assert runner.invoke(cli, ['--board', 'nuevo', 'create-board', 'nuevo']).exit_code == 0
+    assert runner.invoke(cli, ['--board', 'nuevo', 'kanban']).exit_code == 0
+
+@pytest.mark.parametrize('command', ['seed', 'benchmark'])
+def test_seed_and_benchmark_reject_board(db_path, command):
+    runner = CliRunner()
+    runner.invoke(cli, ['create-board', 'equipo-a'])
+    result = runner.invoke(cli, ['--board', 'equipo-a', command, '--tasks', '5'])
+    assert result.exit_code != 0
+    assert 'no admite --board' in result.output
+    
+    token = set_current_board('equipo-a')
+    try:
+        db = get_session()
+        assert db.query(Task).count() == 0
+        db.close()
+    finally:
+        reset_current_board(token)
+
+def test_create_app_does_not_change_engine_limit(db_path):
+    from kanban_app.web import create_app
+    
+    limit = registry.max_engines
+    create_app(run_jobs=False)
+    create_app(run_jobs=False)
+    assert registry.max_engines == limit
@@ -0,0 +1,167 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from kanban_app import jobs
+from kanban_app.database import get_session
+from kanban_app.jobs import (JobRunner, claim_job, enqueue_job, job_handler, recover_stale_jobs,
+                             run_job, worker_loop)
+from kanban_app.models import Job, JobStatus
+
+@job_handler('test_progress')
+def progress_job(params, progress):
+    """Trabajo de prueba que informa de su avance"""
+    progress(1, 2, message='mitad')
+    return {'steps': params.get('steps', 2)}
+
+@job_handler('test_fail')
+def failing_job(params, progress):
+    raise RuntimeError('fallo provocado')
+
+def test_claim_job_only_succeeds_once_under_contention(db):
+    job = enqueue_job(db, 'test_progress')
+    results = []
+    barrier = threading.Barrier(8)
+    
+    def claim():
+        session = get_session()
+        try:
+            barrier.wait()
+            results.append(claim_job(session, job.id))
+        finally:
+            session.close()
+    
+    threads = [threading.Thread(target=claim) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert results.count(True) == 1
+    db.expire_all()
+    assert db.get(Job, job.id).status == JobStatus.RUNNING
+
+def test_job_status_and_progress_via_api(db, client):
+    response = client.post('/api/jobs', json={'type': 'test_progress', 'params': {'steps': 3}})
+    assert response.status_code == 202
+    job = response.get_json()
+    assert job['status'] == 'pending'
+    
+    assert run_job(job['id'])
+    
+    data = client.get(f"/api/jobs/{job['id']}").get_json()
+    assert data['status'] == 'completed'
+    assert data['progress'] == 100
+    assert data['message'] == 'mitad'
+    assert data['result'] == {'steps': 3}
+    assert client.get('/api/jobs/999').status_code == 404
+
+def test_failed_job_reports_error(db, client):
+    job = client.post('/api/jobs', json={'type': 'test_fail'}).get_json()
+    run_job(job['id'])
+    data = client.get(f"/api/jobs/{job['id']}").get_json()
+    assert data['status'] == 'failed'
+    assert data['error'] == 'fallo provocado'
+
+def test_create_job_rejects_invalid_payloads(client):
+    bad_json = client.post('/api/jobs', data='{no es json', content_type='application/json')
+    assert bad_json.status_code == 400
+    assert client.post('/api/jobs', json={'type': 'desconocido'}).status_code == 400
+
+def test_stale_running_jobs_are_requeued(db):
+    stale = enqueue_job(db, 'test_progress')
+    fresh = enqueue_job(db, 'test_progress')
+    claim_job(db, stale.id)
+    claim_job(db, fresh.id)
+    db.query(Job).filter(Job.id == stale.id).update(
+        {Job.updated_at: datetime.utcnow() - timedelta(hours=1)}
+    )
+    db.commit()
+    
+    assert recover_stale_jobs(db) == 1
+    db.expire_all()
+    assert db.get(Job, stale.id).status == JobStatus.PENDING
+    assert db.get(Job, fresh.id).status == JobStatus.RUNNING
+
+def test_runner_resumes_pending_jobs(db):
+    job = enqueue_job(db, 'test_progress')
+    runner = JobRunner(max_workers=1)
+    try:
+        assert runner.resume() == 1
+    finally:
+        runner.shutdown()
+    db.expire_all()
+    assert db.get(Job, job.id).status == JobStatus.COMPLETED
+
+def test_worker_survives_job_errors(db, monkeypatch):
+    first = enqueue_job(db, 'test_progress')
+    second = enqueue_job(db, 'test_progress')
+    original_claim = jobs.claim_job
+    calls = []
+    
+    def flaky_claim(session, job_id):
+        calls.append(job_id)
+        if len(calls) == 1:
+            raise RuntimeError('database is locked')
+        return original_claim(session, job_id)
+    
+    monkeypatch.setattr(jobs, 'claim_job', flaky_claim)
+    processed = worker_loop(concurrency=1, poll_interval=0, once=True)
+    
+    assert processed == 2
+    db.expire_all()
+    assert db.get(Job, first.id).status == JobStatus.COMPLETED
+    assert db.get(Job, second.id).status == JobStatus.COMPLETED
+
+def test_heartbeat_keeps_silent_jobs_alive(db, monkeypatch):
+    monkeypatch.setattr(jobs, 'JOB_HEARTBEAT_INTERVAL', 0.05)
+    release = threading.Event()
+    
+    @job_handler('test_silent')
+    def silent_job(params, progress):
+        # No informa de avances: solo el latido lo mantiene vivo
+        release.wait(5)
+        return {}
+    
+    job = enqueue_job(db, 'test_silent')
+    worker = threading.Thread(target=run_job, args=(job.id,))
+    worker.start()
+    try:
+        time.sleep(0.5)
+        assert recover_stale_jobs(db, stale_after=timedelta(seconds=0.3)) == 0
+    finally:
+        release.set()
+        worker.join()
+    
+    db.expire_all()
+    assert db.get(Job, job.id).status == JobStatus.COMPLETED
+
+def test_requeued_job_is_not_overwritten_by_original_run(db):
+    @job_handler('test_taken_over')
+    def taken_over_job(params, progress):
+        # Mientras se ejecuta, se da por perdido y otro worker lo reclama
+        session = get_session()
+        try:
+            recover_stale_jobs(session, stale_after=timedelta(seconds=-1))
+            time.sleep(0.01)
+            assert claim_job(session, job_id)
+        finally:
+            session.close()
+        progress(50, message='de la ejecución original')
+        return {'original': True}
+    
+    job = enqueue_job(db, 'test_taken_over')
+    job_id = job.id
+    assert run_job(job_id)
+    
+    db.expire_all()
+    current = db.get(Job, job_id)
+    assert current.status == JobStatus.RUNNING
+    assert current.result is None
+    assert current.message == 'Reencolado tras una interrupción'
+
+def test_create_job_rejects_non_object_params(client):
+    for params in ('x', [1], 3):
+        response = client.post('/api/jobs', json={'type': 'test_progress', 'params': params})
+        assert response.status_code == 400
+    assert client.post('/api/jobs', json=['test_progress']).status_code == 400
+    assert client.post('/api/jobs', json={'type': 'test_progress', 'params': {}}).status_code == 202
@@ -0,0 +1,88 @@
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, inspect, text
+from kanban_app.database import create_schema
+from kanban_app.models import Task
+
+def sync(client, since, **params):
+    response = client.get('/api/tasks', query_string={'updated_since': since, **params})
+    assert response.status_code == 200
+    return response.get_json()
+
+def test_updated_since_response_shape(client):
+    created = client.post('/api/tasks', json={'title': 'primera'}).get_json()
+    
+    data = sync(client, '1970-01-01T00:00:00')
+    assert set(data) == {'tasks', 'ids', 'server_time'}
+    assert [t['id'] for t in data['tasks']] == [created['id']]
+    assert data['ids'] == [created['id']]
+    datetime.fromisoformat(data['server_time'])
+
+def test_updated_since_returns_only_changes_and_current_ids(client, monkeypatch):
+    # Sin margen de solapamiento para poder distinguir cambios en milisegundos
+    from kanban_app import web
+    monkeypatch.setattr(web, 'SYNC_OVERLAP', timedelta(0))
+    
+    first = client.post('/api/tasks', json={'title': 'primera'}).get_json()
+    second = client.post('/api/tasks', json={'title': 'segunda'}).get_json()
+    third = client.post('/api/tasks', json={'title': 'tercera'}).get_json()
+    since = sync(client, '1970-01-01T00:00:00')['server_time']
+    time.sleep(0.01)
+    
+    client.put(f"/api/tasks/{first['id']}/status", json={'status': 'completed'})
+    client.delete(f"/api/tasks/{second['id']}")
+    
+    data = sync(client, since)
+    assert [t['id'] for t in data['tasks']] == [first['id']]
+    assert data['tasks'][0]['status'] == 'completed'
+    # El cliente elimina las tareas que ya no aparecen en `ids`
+    assert sorted(data['ids']) == [first['id'], third['id']]
+
+def test_updated_since_lists_ids_of_unchanged_tasks_missing_on_client(client, db):
+    known = client.post('/api/tasks', json={'title': 'conocida'}).get_json()
+    since = sync(client, '1970-01-01T00:00:00')['server_time']
+    
+    # Tarea importada después de la sincronización pero con fecha antigua
+    old = datetime.utcnow() - timedelta(days=90)
+    imported = Task(title='importada', created_at=old, updated_at=old)
+    db.add(imported)
+    db.commit()
+    
+    data = sync(client, since)
+    assert imported.id not in [t['id'] for t in data['tasks']]
+    # El ID aparece aunque la tarea no haya cambiado: el cliente detecta que le
+    # falta y hace una sincronización completa para recuperarla
+    assert sorted(data['ids']) == [known['id'], imported.id]
+    
+    full = sync(client, '1970-01-01T00:00:00')
+    assert sorted(t['id'] for t in full['tasks']) == [known['id'], imported.id]
+
+def test_updated_since_keeps_shape_for_unknown_filters(client):
+    client.post('/api/tasks', json={'title': 'primera', 'project_name': 'Web'})
+    
+    for params in ({'project': 'No existe'}, {'assignee': 'Nadie'}):
+        data = sync(client, '1970-01-01T00:00:00', **params)
+        assert data['tasks'] == [] and data['ids'] == []
+        assert 'server_time' in data
+    
+    assert client.get('/api/tasks?project=No existe').get_json() == []
+
+def test_updated_since_rejects_invalid_dates(client):
+    assert client.get('/api/tasks?updated_since=ayer').status_code == 400
+
+def test_create_schema_adds_missing_indexes_to_existing_tables(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'antigua.db'}")
+    with engine.begin() as conn:
+        # Tabla de tareas tal y como la creaba la versión 1.0.0
+        conn.execute(text(
+            "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(200) NOT NULL, "
+            "description TEXT, project_id INTEGER, assignee_id INTEGER, priority VARCHAR(6), "
+            "status VARCHAR(11), created_at DATETIME, updated_at DATETIME)"
+        ))
+    
+    create_schema(engine)
+    create_schema(engine)
+    
+    indexes = {index['name'] for index in inspect(engine).get_indexes('tasks')}
+    assert 'ix_tasks_updated_at' in indexes
+    engine.dispose()
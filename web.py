@@ -1,9 +1,15 @@
-from flask import Flask, render_template, request, jsonify
-from kanban_app.database import init_db, get_session
-from kanban_app.models import Task, Project, Assignee, TaskStatus, Priority
+from flask import Flask, render_template, request, jsonify, g
+from kanban_app.database import (init_db, get_session, registry, set_current_board,
+                                 reset_current_board, get_current_board, validate_board_name)
+from kanban_app.models import Task, ArchivedTask, Project, Assignee, Job, TaskStatus, Priority
+from kanban_app.jobs import JobRunner, enqueue_job
+from datetime import datetime, timedelta
 import os
 
-def create_app():
+# Margen al sincronizar por updated_at para no perder escrituras concurrentes
+SYNC_OVERLAP = timedelta(seconds=5)
+
+def create_app(run_jobs=True, job_workers=2):
     app = Flask(__name__, 
                 template_folder=os.path.dirname(os.path.abspath(__file__)),
                 static_folder=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static'))
@@ -11,6 +17,31 @@ def create_app():
     # Inicializar la base de datos
     init_db()
     
+    # Ejecutor de trabajos en segundo plano (si no, los procesa el comando `worker`)
+    job_runner = JobRunner(max_workers=job_workers) if run_jobs else None
+    app.extensions['job_runner'] = job_runner
+    if job_runner is not None:
+        # Retomar los trabajos que quedaron pendientes o a medias
+        job_runner.resume()
+    
+    @app.before_request
+    def select_board():
+        """Dirigir la petición a la base de datos de su tablero"""
+        board = request.headers.get('X-Board') or request.args.get('board') or None
+        try:
+            if board is not None and not registry.exists(validate_board_name(board)):
+                return jsonify({'error': f"Tablero no encontrado: '{board}'"}), 404
+            g.board_token = set_current_board(board)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+    
+    @app.teardown_request
+    def release_board(exc):
+        """Restaurar el tablero por defecto al terminar la petición"""
+        token = g.pop('board_token', None)
+        if token is not None:
+            reset_current_board(token)
+    
     @app.route('/')
     def kanban_board():
         """Sirve la página principal del tablero Kanban"""
@@ -30,11 +61,20 @@ def create_app():
             # Obtener parámetros de filtro
             project_filter = request.args.get('project')
             assignee_filter = request.args.get('assignee')
+            include_archived = request.args.get('include_archived', '').lower() in ('1', 'true', 'yes')
+            updated_since = request.args.get('updated_since')
             
             print(f"Filtros recibidos - Proyecto: {project_filter}, Responsable: {assignee_filter}")  # Para debugging
             
-            # Construir consulta
+            # Respuesta vacía con la misma forma que la consulta normal
+            if updated_since is not None:
+                empty_result = {'tasks': [], 'ids': [], 'server_time': datetime.utcnow().isoformat()}
+            else:
+                empty_result = []
+            
+            # Construir consulta (las tareas archivadas solo si se piden)
             query = db.query(Task)
+            archived_query = db.query(ArchivedTask)
             
             # Aplicar filtro por proyecto si se especifica
             if project_filter:
@@ -42,10 +82,11 @@ def create_app():
                 print(f"Proyecto encontrado: {project}")  # Para debugging
                 if project:
                     query = query.filter(Task.project_id == project.id)
+                    archived_query = archived_query.filter(ArchivedTask.project_id == project.id)
                 else:
                     # Si el proyecto no existe, devolver lista vacía
                     print("Proyecto no encontrado, devolviendo lista vacía")  # Para debugging
-                    return jsonify([])
+                    return jsonify(empty_result)
             
             # Aplicar filtro por responsable si se especifica
             if assignee_filter:
@@ -53,12 +94,31 @@ def create_app():
                 print(f"Responsable encontrado: {assignee}")  # Para debugging
                 if assignee:
                     query = query.filter(Task.assignee_id == assignee.id)
+                    archived_query = archived_query.filter(ArchivedTask.assignee_id == assignee.id)
                 else:
                     # Si el responsable no existe, devolver lista vacía
                     print("Responsable no encontrado, devolviendo lista vacía")  # Para debugging
-                    return jsonify([])
+                    return jsonify(empty_result)
+            
+            # Sincronización incremental: solo tareas modificadas y los IDs vigentes
+            if updated_since is not None:
+                try:
+                    since = datetime.fromisoformat(updated_since)
+                except ValueError:
+                    return jsonify({'error': 'Fecha updated_since inválida'}), 400
+                
+                server_time = datetime.utcnow()
+                ids = [row[0] for row in query.with_entities(Task.id).all()]
+                changed = query.filter(Task.updated_at > since - SYNC_OVERLAP).all()
+                return jsonify({
+                    'tasks': [task.to_dict() for task in changed],
+                    'ids': ids,
+                    'server_time': server_time.isoformat()
+                })
             
             tasks = query.all()
+            if include_archived:
+                tasks += archived_query.all()
             print(f"Tareas encontradas: {len(tasks)}")  # Para debugging
             return jsonify([task.to_dict() for task in tasks])
         except Exception as e:
@@ -199,7 +259,6 @@ def create_app():
                     pass  # Mantener valor actual
             
             # Actualizar la fecha de modificación
-            from datetime import datetime
             task.updated_at = datetime.utcnow()
             db.commit()
             
@@ -252,7 +311,6 @@ def create_app():
                 return jsonify({'error': 'Estado inválido'}), 400
             
             # Actualizar la fecha de modificación
-            from datetime import datetime
             task.updated_at = datetime.utcnow()
             db.commit()
             
@@ -276,6 +334,81 @@ def create_app():
         finally:
             db.close()
     
+    @app.route('/api/jobs', methods=['POST'])
+    def create_job():
+        """Encolar un trabajo en segundo plano"""
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or not data.get('type'):
+            return jsonify({'error': 'Datos inválidos'}), 400
+        if data.get('params') is not None and not isinstance(data['params'], dict):
+            return jsonify({'error': 'Los parámetros deben ser un objeto'}), 400
+        
+        db = get_session()
+        try:
+            try:
+                job = enqueue_job(db, data['type'], data.get('params'))
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            if job_runner is not None:
+                job_runner.submit(job.id, get_current_board())
+            
+            return jsonify(job.to_dict()), 202
+        except Exception as e:
+            db.rollback()
+            return jsonify({'error': str(e)}), 500
+        finally:
+            db.close()
+    
+    @app.route('/api/jobs', methods=['GET'])
+    def get_jobs():
+        """Obtener los trabajos más recientes"""
+        try:
+            db = get_session()
+            jobs = db.query(Job).order_by(Job.id.desc()).limit(50).all()
+            return jsonify([job.to_dict() for job in jobs])
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+        finally:
+            db.close()
+    
+    @app.route('/api/jobs/<int:job_id>', methods=['GET'])
+    def get_job(job_id):
+        """Obtener el estado y el progreso de un trabajo"""
+        try:
+            db = get_session()
+            
+            job = db.query(Job).filter(Job.id == job_id).first()
+            if not job:
+                return jsonify({'error': 'Trabajo no encontrado'}), 404
+            
+            return jsonify(job.to_dict())
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+        finally:
+            db.close()
+    
+    @app.route('/api/boards', methods=['GET'])
+    def get_boards():
+        """Obtener los tableros existentes"""
+        return jsonify({'current': get_current_board(), 'boards': registry.list_boards()})
+    
+    @app.route('/api/boards', methods=['POST'])
+    def create_board():
+        """Crear un tablero nuevo"""
+        data = request.get_json(silent=True)
+        if not data or not data.get('name'):
+            return jsonify({'error': 'Datos inválidos'}), 400
+        
+        try:
+            created = registry.create_board(data['name'])
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        if not created:
+            return jsonify({'error': f"El tablero '{data['name']}' ya existe"}), 409
+        return jsonify({'name': data['name']}), 201
+    
     @app.route('/api/assignees', methods=['GET'])
     def get_assignees():
         """Obtener todos los responsables"""